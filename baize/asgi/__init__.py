@@ -1,4 +1,10 @@
-from baize.asgi.helper import empty_receive, empty_send, send_http_body, send_http_start
+from baize.asgi.helper import (
+    empty_receive,
+    empty_send,
+    send_http_body,
+    send_http_empty_response,
+    send_http_start,
+)
 from baize.asgi.requests import ClientDisconnect, HTTPConnection, Request
 from baize.asgi.responses import (
     FileResponse,
@@ -27,6 +33,7 @@ __all__ = [
     "empty_send",
     "send_http_start",
     "send_http_body",
+    "send_http_empty_response",
     "ClientDisconnect",
     "HTTPConnection",
     "Request",
@@ -30,6 +30,24 @@ async def send_http_body(
     await send({"type": "http.response.body", "body": body, "more_body": more_body})
 
 
+async def send_http_empty_response(
+    send: Send,
+    status_code: int,
+    headers: Optional[Iterable[Tuple[bytes, bytes]]] = None,
+) -> None:
+    """
+    helper function for send a response without body, e.g. 304/404/redirect
+
+    Equivalent to `send_http_start` followed by `send_http_body`, without the
+    extra coroutine frames.
+    """
+    message = {"type": "http.response.start", "status": status_code}
+    if headers is not None:
+        message["headers"] = headers
+    await send(message)
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
 async def empty_receive() -> Message:
     raise NotImplementedError("Receive channel has not been made available")
 
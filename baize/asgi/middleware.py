@@ -126,13 +126,12 @@ def middleware(
         This is the actual middleware.
         """
 
+        async def next_call(request: NextRequest) -> NextResponse:
+            return await NextResponse.from_app(app, request)
+
         @functools.wraps(app)
         async def asgi(scope: Scope, receive: Receive, send: Send) -> None:
             request = NextRequest(scope, receive, send)
-
-            async def next_call(request: NextRequest) -> NextResponse:
-                return await NextResponse.from_app(app, request)
-
             response = await handler(request, next_call)
             await response(scope, receive, send)
 
@@ -99,8 +99,10 @@ class HTTPConnection(Mapping[str, Any], MoreInfoFromHeaderMixin):
         Note that in its internal storage, all keys are in lower case.
         """
         return Headers(
-            (key.decode("latin-1"), value.decode("latin-1"))
-            for key, value in self._scope["headers"]
+            [
+                (key.decode("latin-1"), value.decode("latin-1"))
+                for key, value in self._scope["headers"]
+            ]
         )
 
 
@@ -3,7 +3,7 @@ import asyncio
 import json
 import os
 import stat
-from mimetypes import guess_type
+import sys
 from random import choices as random_choices
 from typing import (
     Any,
@@ -11,6 +11,7 @@ from typing import (
     AsyncIterable,
     Dict,
     Generic,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -26,11 +27,31 @@ from baize.responses import (
     BaseResponse,
     FileResponseMixin,
     build_bytes_from_sse,
+    guess_content_type,
     iri_to_uri,
 )
 from baize.typing import Protocol, Receive, Scope, Send, ServerSentEvent
 
-from .helper import send_http_body, send_http_start
+from .helper import send_http_body, send_http_empty_response, send_http_start
+
+_PING = b": ping\n\n"
+
+if sys.version_info >= (3, 11):
+
+    async def _get_with_timeout(
+        q: "asyncio.Queue[ServerSentEvent | None]", timeout: float
+    ) -> "ServerSentEvent | None":
+        # `asyncio.timeout` is a cancellation scope on the current task, unlike
+        # `asyncio.wait_for` which wraps every `q.get()` in a new Task.
+        async with asyncio.timeout(timeout):
+            return await q.get()
+
+else:
+
+    async def _get_with_timeout(
+        q: "asyncio.Queue[ServerSentEvent | None]", timeout: float
+    ) -> "ServerSentEvent | None":
+        return await asyncio.wait_for(q.get(), timeout=timeout)
 
 
 class Response(BaseResponse):
@@ -41,8 +62,9 @@ class Response(BaseResponse):
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         self.headers["content-length"] = "0"
-        await send_http_start(send, self.status_code, self.list_headers(as_bytes=True))
-        return await send_http_body(send)
+        await send_http_empty_response(
+            send, self.status_code, self.list_headers(as_bytes=True)
+        )
 
 
 _ContentType = TypeVar("_ContentType")
@@ -73,8 +95,10 @@ class SmallResponse(Response, abc.ABC, Generic[_ContentType]):
     async def render(self, content: _ContentType) -> bytes:
         raise NotImplementedError
 
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        body = await self.render(self.content)
+    def set_body_headers(self, body: bytes) -> None:
+        """
+        Fill in `content-length` and `content-type` unless they were given.
+        """
         if body and "content-length" not in self.headers:
             content_length = str(len(body))
             self.headers["content-length"] = content_length
@@ -83,15 +107,34 @@ class SmallResponse(Response, abc.ABC, Generic[_ContentType]):
             if content_type.startswith("text/"):
                 content_type += "; charset=" + self.charset
             self.headers["content-type"] = content_type
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        body = await self.render(self.content)
+        self.set_body_headers(body)
         await send_http_start(send, self.status_code, self.list_headers(as_bytes=True))
         await send_http_body(send, body)
 
 
 class PlainTextResponse(SmallResponse[Union[bytes, str]]):
+    """
+    The encoded body is reused while `content` stays the same object and
+    `charset` is unchanged, so a response object can be sent repeatedly.
+    """
+
     media_type = "text/plain"
+    _rendered: Optional[Tuple[Union[bytes, str], str, bytes]] = None
 
     async def render(self, content: Union[bytes, str]) -> bytes:
-        return content.encode(self.charset) if isinstance(content, str) else content
+        rendered = self._rendered
+        if (
+            rendered is not None
+            and rendered[0] is content
+            and rendered[1] == self.charset
+        ):
+            return rendered[2]
+        body = content.encode(self.charset) if isinstance(content, str) else content
+        self._rendered = (content, self.charset, body)
+        return body
 
 
 class HTMLResponse(PlainTextResponse):
@@ -266,17 +309,19 @@ class SendEventResponse(StreamingResponse[ServerSentEvent]):
         try:
             while not (push_future.done() and q.empty()):
                 try:
-                    event = await asyncio.wait_for(q.get(), timeout=self.ping_interval)
+                    event = await _get_with_timeout(q, self.ping_interval)
                     if event is None:
                         break
                     yield build_bytes_from_sse(event, self.charset)
                 except asyncio.TimeoutError:
-                    yield b": ping\n\n"
+                    yield _PING
         finally:
             should_stop = True
             while not q.empty():
                 q.get_nowait()  # pragma: no cover
-            if not push_future.cancel():
+            # A task that was already cancelled must not surface its
+            # CancelledError here through `exception()`.
+            if not push_future.cancel() and not push_future.cancelled():
                 exc = push_future.exception()
                 if exc is not None:
                     raise exc
@@ -308,6 +353,18 @@ else:  # pragma: py-win32
         return await run_in_threadpool(os.open, path, os.O_RDONLY)
 
 
+if hasattr(os, "pread"):  # pragma: py-win32
+
+    def read_at(file_descriptor: int, length: int, offset: int) -> bytes:
+        return os.pread(file_descriptor, length, offset)
+
+else:  # pragma: py-no-win32
+
+    def read_at(file_descriptor: int, length: int, offset: int) -> bytes:
+        os.lseek(file_descriptor, offset, os.SEEK_SET)
+        return os.read(file_descriptor, length)
+
+
 class FileResponse(Response, FileResponseMixin):
     """
     File response.
@@ -329,7 +386,7 @@ class FileResponse(Response, FileResponseMixin):
         self.filepath = filepath
         self.content_type = (
             content_type
-            or guess_type(download_name or os.path.basename(filepath))[0]
+            or guess_content_type(download_name or os.path.basename(filepath))
             or "application/octet-stream"
         )
         self.download_name = download_name
@@ -343,6 +400,23 @@ class FileResponse(Response, FileResponseMixin):
             )
         )
 
+    def _list_headers_with(
+        self, headers: Dict[bytes, bytes]
+    ) -> List[Tuple[bytes, bytes]]:
+        """
+        Like `self.list_headers(as_bytes=True)`, but `headers` override the
+        same-named entries for this call only. `self.headers` stays untouched,
+        so one instance can serve concurrent requests.
+        """
+        return [
+            *(
+                item
+                for item in self.list_headers(as_bytes=True)
+                if item[0] not in headers
+            ),
+            *headers.items(),
+        ]
+
     def create_send_or_zerocopy(self, scope: Scope, send: Send) -> Sendfile:
         """
         https://asgi.readthedocs.io/en/latest/extensions.html#zero-copy-send
@@ -378,17 +452,24 @@ class FileResponse(Response, FileResponseMixin):
                 count: Optional[int] = None,
                 more_body: bool = False,
             ) -> None:
-                if offset is not None:
-                    await run_in_threadpool(
-                        os.lseek, file_descriptor, offset, os.SEEK_SET
+                position = offset
+
+                async def read(length: int) -> bytes:
+                    nonlocal position
+                    if position is None:
+                        return await run_in_threadpool(os.read, file_descriptor, length)
+                    data = await run_in_threadpool(
+                        read_at, file_descriptor, length, position
                     )
+                    position += len(data)
+                    return data
 
                 here = 0
                 should_stop = False
                 if count is None:
                     length = self.chunk_size
                     while not should_stop:
-                        data = await run_in_threadpool(os.read, file_descriptor, length)
+                        data = await read(length)
                         if len(data) == length:
                             await send_http_body(send, data, more_body=True)
                         else:
@@ -399,7 +480,7 @@ class FileResponse(Response, FileResponseMixin):
                         length = min(self.chunk_size, count - here)
                         should_stop = length == count - here
                         here += length
-                        data = await run_in_threadpool(os.read, file_descriptor, length)
+                        data = await read(length)
                         await send_http_body(
                             send, data, more_body=more_body if should_stop else True
                         )
@@ -409,18 +490,31 @@ class FileResponse(Response, FileResponseMixin):
     async def handle_all(
         self, send_header_only: bool, file_size: int, scope: Scope, send: Send
     ) -> None:
-        self.headers["content-type"] = str(self.content_type)
-        self.headers["content-length"] = str(file_size)
-        await send_http_start(send, 200, self.list_headers(as_bytes=True))
+        headers = self._list_headers_with(
+            {
+                b"content-type": self.content_type.encode("latin-1"),
+                b"content-length": str(file_size).encode("ascii"),
+            }
+        )
+        await send_http_start(send, 200, headers)
         if send_header_only:
             return await send_http_body(send)
 
+        if "http.response.pathsend" in scope.get("extensions", {}):
+            # https://asgi.readthedocs.io/en/latest/extensions.html#path-send
+            return await send(
+                {
+                    "type": "http.response.pathsend",
+                    "path": os.path.abspath(self.filepath),
+                }
+            )
+
         sendfile = self.create_send_or_zerocopy(scope, send)
         file_descriptor = await open_for_sendfile(self.filepath)
         try:
             await sendfile(file_descriptor)
         finally:
-            await run_in_threadpool(os.close, file_descriptor)
+            os.close(file_descriptor)
 
     async def handle_single_range(
         self,
@@ -431,10 +525,15 @@ class FileResponse(Response, FileResponseMixin):
         start: int,
         end: int,
     ) -> None:
-        self.headers["content-range"] = f"bytes {start}-{end-1}/{file_size}"
-        self.headers["content-type"] = str(self.content_type)
-        self.headers["content-length"] = str(end - start)
-        await send_http_start(send, 206, self.list_headers(as_bytes=True))
+        content_range = f"bytes {start}-{end-1}/{file_size}"
+        headers = self._list_headers_with(
+            {
+                b"content-range": content_range.encode("ascii"),
+                b"content-type": self.content_type.encode("latin-1"),
+                b"content-length": str(end - start).encode("ascii"),
+            }
+        )
+        await send_http_start(send, 206, headers)
         if send_header_only:
             return await send_http_body(send)
 
@@ -443,7 +542,7 @@ class FileResponse(Response, FileResponseMixin):
         try:
             await sendfile(file_descriptor, start, end - start)
         finally:
-            await run_in_threadpool(os.close, file_descriptor)
+            os.close(file_descriptor)
 
     async def handle_several_ranges(
         self,
@@ -454,24 +553,35 @@ class FileResponse(Response, FileResponseMixin):
         ranges: Sequence[Tuple[int, int]],
     ) -> None:
         boundary = "".join(random_choices("abcdefghijklmnopqrstuvwxyz0123456789", k=13))
-        self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
         content_length, generate_headers = self.generate_multipart(
             ranges, boundary, file_size, self.content_type
         )
-        self.headers["content-length"] = str(content_length)
-        await send_http_start(send, 206, self.list_headers(as_bytes=True))
+        content_type = f"multipart/byteranges; boundary={boundary}"
+        headers = self._list_headers_with(
+            {
+                b"content-type": content_type.encode("ascii"),
+                b"content-length": str(content_length).encode("ascii"),
+            }
+        )
+        await send_http_start(send, 206, headers)
         if send_header_only:
             return await send_http_body(send)
         sendfile = self.create_send_or_zerocopy(scope, send)
         file_descriptor = await open_for_sendfile(self.filepath)
         try:
+            # The "\n" closing each part is sent together with what follows it
+            separator = b""
             for start, end in ranges:
-                await send_http_body(send, generate_headers(start, end), more_body=True)
+                await send_http_body(
+                    send, separator + generate_headers(start, end), more_body=True
+                )
                 await sendfile(file_descriptor, start, end - start, True)
-                await send_http_body(send, b"\n", more_body=True)
-            return await send_http_body(send, f"--{boundary}--\n".encode("ascii"))
+                separator = b"\n"
+            return await send_http_body(
+                send, separator + f"--{boundary}--\n".encode("ascii")
+            )
         finally:
-            await run_in_threadpool(os.close, file_descriptor)
+            os.close(file_descriptor)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         send_header_only = scope["method"] == "HEAD"
@@ -1,6 +1,6 @@
 import os
 import stat
-from typing import Optional
+from typing import Optional, Tuple
 
 from baize import staticfiles
 from baize.datastructures import URL
@@ -9,6 +9,30 @@ from baize.typing import ASGIApp, Receive, Scope, Send
 
 from .responses import FileResponse, RedirectResponse, Response
 
+_IF_NONE_MATCH = b"if-none-match"
+_IF_MODIFIED_SINCE = b"if-modified-since"
+
+
+def get_conditional_headers(scope: Scope) -> Tuple[str, str]:
+    """
+    Return the values of `If-None-Match` and `If-Modified-Since` in scope.
+    """
+    if_none_match: str = ""
+    if_modified_since: str = ""
+    found = 0
+    for k, v in scope["headers"]:
+        if k == _IF_NONE_MATCH:
+            if_none_match = v.decode("latin-1")
+            found |= 1
+        elif k == _IF_MODIFIED_SINCE:
+            if_modified_since = v.decode("latin-1")
+            found |= 2
+        else:
+            continue
+        if found == 3:
+            break
+    return if_none_match, if_modified_since
+
 
 class Files(staticfiles.BaseFiles[ASGIApp]):
     """
@@ -25,9 +49,7 @@ class Files(staticfiles.BaseFiles[ASGIApp]):
         if_none_match: str,
         if_modified_since: str,
     ) -> Response:
-        if self.if_none_match(
-            FileResponse.generate_etag(stat_result), if_none_match
-        ) or self.if_modified_since(stat_result.st_ctime, if_modified_since):
+        if self.not_modified(stat_result, if_none_match, if_modified_since):
             response = Response(304)
         else:
             response = FileResponse(filepath, stat_result=stat_result)
@@ -35,17 +57,11 @@ class Files(staticfiles.BaseFiles[ASGIApp]):
         return response
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if_none_match: str = ""
-        if_modified_since: str = ""
-        for k, v in scope["headers"]:
-            if k == b"if-none-match":
-                if_none_match = v.decode("latin-1")
-            elif k == b"if-modified-since":
-                if_modified_since = v.decode("latin-1")
         filepath = self.ensure_absolute_path(scope["path"])
         stat_result, is_file = self.check_path_is_file(filepath)
         if is_file and stat_result:
             assert filepath is not None  # Just for type check
+            if_none_match, if_modified_since = get_conditional_headers(scope)
             return await self.file_response(
                 filepath, stat_result, if_none_match, if_modified_since
             )(scope, receive, send)
@@ -67,13 +83,6 @@ class Pages(Files):
     """
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if_none_match: str = ""
-        if_modified_since: str = ""
-        for k, v in scope["headers"]:
-            if k == b"if-none-match":
-                if_none_match = v.decode("latin-1")
-            elif k == b"if-modified-since":
-                if_modified_since = v.decode("latin-1")
         filepath = self.ensure_absolute_path(scope["path"])
         stat_result, is_file = self.check_path_is_file(filepath)
         if (
@@ -87,6 +96,7 @@ class Pages(Files):
         if stat_result is not None:
             assert filepath is not None  # Just for type check
             if is_file:
+                if_none_match, if_modified_since = get_conditional_headers(scope)
                 return await self.file_response(
                     filepath, stat_result, if_none_match, if_modified_since
                 )(scope, receive, send)
@@ -1,5 +1,5 @@
 import enum
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Iterable, Optional, Union
 
 from baize.typing import Message, Receive, Scope, Send
 
@@ -16,7 +16,7 @@ class WebSocketDisconnect(Exception):
         return f"WebSocketDisconnect(code={self.code}, reason={self.reason})"
 
 
-class WebSocketState(enum.Enum):
+class WebSocketState(enum.IntEnum):
     CONNECTING = enum.auto()
     CONNECTED = enum.auto()
     DISCONNECTED = enum.auto()
@@ -36,13 +36,24 @@ class WebSocket(HTTPConnection):
         if self.client_state == WebSocketState.CONNECTING:
             message = await self._receive()
             message_type = message["type"]
-            assert message_type == "websocket.connect"
+            if message_type != "websocket.connect":
+                raise RuntimeError(
+                    'Expected ASGI message "websocket.connect", '
+                    f"but got {message_type!r}"
+                )
             self.client_state = WebSocketState.CONNECTED
             return message
         elif self.client_state == WebSocketState.CONNECTED:
             message = await self._receive()
             message_type = message["type"]
-            assert message_type in {"websocket.receive", "websocket.disconnect"}
+            if (
+                message_type != "websocket.receive"
+                and message_type != "websocket.disconnect"
+            ):
+                raise RuntimeError(
+                    'Expected ASGI message "websocket.receive" or '
+                    f'"websocket.disconnect", but got {message_type!r}'
+                )
             if message_type == "websocket.disconnect":
                 self.client_state = WebSocketState.DISCONNECTED
             return message
@@ -57,7 +68,11 @@ class WebSocket(HTTPConnection):
         """
         if self.application_state == WebSocketState.CONNECTING:
             message_type = message["type"]
-            assert message_type in {"websocket.accept", "websocket.close"}
+            if message_type != "websocket.accept" and message_type != "websocket.close":
+                raise RuntimeError(
+                    'Expected ASGI message "websocket.accept" or '
+                    f'"websocket.close", but got {message_type!r}'
+                )
             if message_type == "websocket.close":
                 self.application_state = WebSocketState.DISCONNECTED
             else:
@@ -65,7 +80,11 @@ class WebSocket(HTTPConnection):
             await self._send(message)
         elif self.application_state == WebSocketState.CONNECTED:
             message_type = message["type"]
-            assert message_type in {"websocket.send", "websocket.close"}
+            if message_type != "websocket.send" and message_type != "websocket.close":
+                raise RuntimeError(
+                    'Expected ASGI message "websocket.send" or '
+                    f'"websocket.close", but got {message_type!r}'
+                )
             if message_type == "websocket.close":
                 self.application_state = WebSocketState.DISCONNECTED
             await self._send(message)
@@ -81,17 +100,14 @@ class WebSocket(HTTPConnection):
             await self.receive()
         await self.send({"type": "websocket.accept", "subprotocol": subprotocol})
 
-    def _raise_on_disconnect(self, message: Message) -> None:
-        if message["type"] == "websocket.disconnect":
-            raise WebSocketDisconnect(message["code"], message.get("reason"))
-
     async def receive_text(self) -> str:
         """
         Receive a WebSocket text frame and return.
         """
         assert self.application_state == WebSocketState.CONNECTED
         message = await self.receive()
-        self._raise_on_disconnect(message)
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message["code"], message.get("reason"))
         return message["text"]
 
     async def receive_bytes(self) -> bytes:
@@ -100,28 +116,31 @@ class WebSocket(HTTPConnection):
         """
         assert self.application_state == WebSocketState.CONNECTED
         message = await self.receive()
-        self._raise_on_disconnect(message)
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message["code"], message.get("reason"))
         return message["bytes"]
 
     async def iter_text(self) -> AsyncIterator[str]:
         """
         Keep receiving text frames until the WebSocket connection is disconnected.
         """
-        try:
-            while True:
-                yield await self.receive_text()
-        except WebSocketDisconnect:
-            pass
+        while True:
+            assert self.application_state == WebSocketState.CONNECTED
+            message = await self.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            yield message["text"]
 
     async def iter_bytes(self) -> AsyncIterator[bytes]:
         """
         Keep receiving binary frames until the WebSocket connection is disconnected.
         """
-        try:
-            while True:
-                yield await self.receive_bytes()
-        except WebSocketDisconnect:
-            pass
+        while True:
+            assert self.application_state == WebSocketState.CONNECTED
+            message = await self.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            yield message["bytes"]
 
     async def send_text(self, data: str) -> None:
         """
@@ -135,6 +154,22 @@ class WebSocket(HTTPConnection):
         """
         await self.send({"type": "websocket.send", "bytes": data})
 
+    async def send_many(self, frames: Iterable[Union[str, bytes]]) -> None:
+        """
+        Send several WebSocket frames, checking the connection state only once.
+        `str` is sent as a text frame, `bytes` as a binary frame.
+        """
+        if self.application_state != WebSocketState.CONNECTED:
+            raise RuntimeError(
+                'Cannot call "send_many" before accepting or after closing.'
+            )
+        send = self._send
+        for frame in frames:
+            if isinstance(frame, str):
+                await send({"type": "websocket.send", "text": frame})
+            else:
+                await send({"type": "websocket.send", "bytes": frame})
+
     async def close(self, code: int = 1000, reason: Optional[str] = None) -> None:
         """
         Close WebSocket connection. It can be called multiple times.
@@ -160,9 +195,8 @@ class WebsocketDenialResponse:
         self.response = response
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        assert (
-            scope["type"] == "websocket"
-        ), "WebsocketDenialResponse requires a websocket scope"
+        if __debug__ and scope["type"] != "websocket":
+            raise TypeError("WebsocketDenialResponse requires a websocket scope")
 
         # Check if Websocket Denial Response can be used
         if self.response is None or "websocket.http.response" not in scope.get(
@@ -175,10 +209,10 @@ class WebsocketDenialResponse:
             # between http/websocket ASGI protocols
 
             async def ws_send(msg: Message) -> None:
-                if msg["type"] not in WEBSOCKET_DENIAL_RESPONSE_MAPPING:
+                message_type = WEBSOCKET_DENIAL_RESPONSE_MAPPING.get(msg["type"])
+                if message_type is None:
                     raise ValueError(f"Unsupported message type: {msg['type']}")
-                else:
-                    msg["type"] = WEBSOCKET_DENIAL_RESPONSE_MAPPING[msg["type"]]
+                msg["type"] = message_type
                 await send(msg)
 
             async def ws_receive() -> Message:
@@ -18,12 +18,17 @@ class ThreadPoolExecutor(_ThreadPoolExecutor):  # type: ignore
     Thread pool with ContextVars
 
     - https://github.com/python/cpython/issues/78195
+
+    Set `propagate_context` to `False` (on the class or an instance) to skip
+    copying the context when the submitted functions don't use ContextVars.
     """
 
+    propagate_context: bool = True
+
     def submit(self, __fn, *args, **kwargs):
-        return super().submit(
-            functools.partial(copy_context().run, __fn), *args, **kwargs
-        )
+        if not self.propagate_context:
+            return super().submit(__fn, *args, **kwargs)
+        return super().submit(copy_context().run, __fn, *args, **kwargs)
 
 
 async def run_in_threadpool(__fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
@@ -38,5 +43,7 @@ async def run_in_threadpool(__fn: Callable[..., T], *args: Any, **kwargs: Any) -
     """
     loop = asyncio.get_running_loop()
     ctx = copy_context()
+    if not kwargs:  # `run_in_executor` passes positional arguments by itself
+        return await loop.run_in_executor(None, ctx.run, __fn, *args)
     func_call = functools.partial(ctx.run, __fn, *args, **kwargs)
     return await loop.run_in_executor(None, cast(Callable[[], T], func_call))
@@ -1,8 +1,11 @@
 import datetime
+import functools
 import os
-import re
+import shutil
 import string
+import sys
 import typing
+from collections import Counter
 from tempfile import SpooledTemporaryFile
 from urllib.parse import SplitResult, parse_qsl, urlencode, urlsplit
 
@@ -37,27 +40,46 @@ class Address(typing.NamedTuple):
 
 
 class defaultdict(dict):
+    """
+    Like `collections.defaultdict`, but `default_factory` receives the missing
+    key. The result is stored, so the factory runs once per key.
+    """
+
+    __slots__ = ("default_factory",)
+
     def __init__(self, default_factory, *args, **kwargs) -> None:
         self.default_factory = default_factory
         super().__init__(*args, **kwargs)
 
     def __missing__(self, key):
-        return self.default_factory(key)
+        value = self[key] = self.default_factory(key)
+        return value
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_header(line: str) -> typing.Tuple[str, typing.Dict[str, str]]:
+    """
+    `parse_header` for the few distinct media type lines a server keeps
+    seeing. The returned options are shared, copy them before exposing.
+    """
+    return parse_header(line)
 
 
 class MediaType:
     __slots__ = ("main_type", "sub_type", "options")
 
     def __init__(self, media_type_raw_line: str) -> None:
-        full_type, self.options = parse_header(media_type_raw_line)
+        full_type, options = _parse_header(media_type_raw_line)
+        self.options = dict(options)
         self.main_type, _, self.sub_type = full_type.partition("/")
 
     def __str__(self) -> str:
-        return (
-            self.main_type
-            + (f"/{self.sub_type}" if self.sub_type else "")
-            + "".join(f"; {k}={v}" for k, v in self.options.items())
-        )
+        media_type = self.main_type
+        if self.sub_type:
+            media_type = f"{media_type}/{self.sub_type}"
+        if not self.options:
+            return media_type
+        return media_type + "".join([f"; {k}={v}" for k, v in self.options.items()])
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__qualname__}: {self}>"
@@ -69,23 +91,25 @@ class MediaType:
     def match(self, other: str) -> bool:
         if self.is_all_types:
             return True
-        other_media_type = MediaType(other)
-        return self.main_type == other_media_type.main_type and (
-            self.sub_type in {"*", other_media_type.sub_type}
-        )
+        # Only the type is needed, so skip building a `MediaType` and its options
+        main_type, _, sub_type = _parse_header(other)[0].partition("/")
+        return self.main_type == main_type and self.sub_type in ("*", sub_type)
 
 
 class ContentType:
     __slots__ = ("type", "options")
 
     def __init__(self, content_type_raw_line: str) -> None:
-        self.type, self.options = parse_header(content_type_raw_line)
+        self.type, options = _parse_header(content_type_raw_line)
+        self.options = dict(options)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__qualname__}: {self}>"
 
     def __str__(self) -> str:
-        return self.type + "".join(f"; {k}={v}" for k, v in self.options.items())
+        if not self.options:
+            return self.type
+        return self.type + "".join([f"; {k}={v}" for k, v in self.options.items()])
 
     def __eq__(self, other: typing.Any) -> bool:
         if not isinstance(other, str):
@@ -96,7 +120,6 @@ class ContentType:
 _cookie_legal_chars: Final[str] = (
     string.ascii_letters + string.digits + "!#$%&'*+-.^_`|~:"
 )
-_cookie_is_legal_key = re.compile("[%s]+" % re.escape(_cookie_legal_chars)).fullmatch
 _cookie_translator: Final[typing.Dict[int, str]] = {
     **{
         n: "\\%03o" % n
@@ -105,6 +128,46 @@ _cookie_translator: Final[typing.Dict[int, str]] = {
     ord('"'): '\\"',
     ord("\\"): "\\\\",
 }
+# Legal bytes map to themselves, everything else to 0xFF (itself illegal)
+_cookie_legal_table: Final[bytes] = bytes(
+    n if chr(n) in _cookie_legal_chars else 0xFF for n in range(256)
+)
+_weekday_names: Final[typing.Tuple[str, ...]] = (
+    "Mon",
+    "Tue",
+    "Wed",
+    "Thu",
+    "Fri",
+    "Sat",
+    "Sun",
+)
+_month_names: Final[typing.Tuple[str, ...]] = (
+    "",
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+
+def _format_cookie_expires(expires: datetime.datetime) -> str:
+    """
+    Same as `expires.strftime("%a, %d %b %Y %H:%M:%S GMT")` in the C locale,
+    without going through strftime (which also follows the current locale)
+    """
+    return (
+        f"{_weekday_names[expires.weekday()]}, {expires.day:02d} "
+        f"{_month_names[expires.month]} {expires.year:04d} "
+        f"{expires.hour:02d}:{expires.minute:02d}:{expires.second:02d} GMT"
+    )
 
 
 class Cookie:
@@ -138,7 +201,9 @@ class Cookie:
         string.  Otherwise, surround the string in doublequotes and quote
         (with a \) special characters.
         """
-        if _cookie_is_legal_key(value):
+        if value and 0xFF not in value.encode("latin-1", "replace").translate(
+            _cookie_legal_table
+        ):
             return value
         else:
             return '"' + value.translate(_cookie_translator) + '"'
@@ -147,10 +212,8 @@ class Cookie:
         parts: typing.List[str] = []
         parts.append(f"{self._quote(self.name)}={self._quote(self.value)}")
 
-        if self.expires:
-            parts.append(
-                "expires=" + self.expires.strftime("%a, %d %b %Y %H:%M:%S GMT")
-            )
+        if self.expires is not None:
+            parts.append("expires=" + _format_cookie_expires(self.expires))
 
         if self.max_age > -1:
             parts.append(f"max-age={self.max_age}")
@@ -187,9 +250,56 @@ class Cookie:
         return f"<Cookie {self.name}: {self.value}>"
 
 
+_DEFAULT_PORTS: Final[typing.Dict[str, int]] = {
+    "http": 80,
+    "https": 443,
+    "ws": 80,
+    "wss": 443,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _urlsplit(url: str) -> SplitResult:
+    return urlsplit(url)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_netloc(
+    netloc: str,
+) -> typing.Tuple[typing.Optional[str], typing.Optional[str], typing.Optional[str]]:
+    """
+    `(username, password, hostname)` of netloc, parsed once per distinct value
+    """
+    components = SplitResult("", netloc, "", "", "")
+    return components.username, components.password, components.hostname
+
+
+@functools.lru_cache(maxsize=256)
+def _netloc_port(netloc: str) -> typing.Optional[int]:
+    return SplitResult("", netloc, "", "", "").port
+
+
+def _parse_qsl(qs: str) -> typing.List[typing.Tuple[str, str]]:
+    """
+    `parse_qsl(qs, keep_blank_values=True)`, skipping the unquoting when
+    there is nothing to unquote
+    """
+    if "%" in qs or "+" in qs:
+        return parse_qsl(qs, keep_blank_values=True)
+    pairs: typing.List[typing.Tuple[str, str]] = []
+    for field in qs.split("&"):
+        if field:
+            key, _, value = field.partition("=")
+            pairs.append((key, value))
+    return pairs
+
+
 class URL:
     __slots__ = ("_url", "_components")
 
+    _url: str
+    _components: typing.Optional[SplitResult]
+
     def __init__(
         self,
         url: str = "",
@@ -200,7 +310,9 @@ class URL:
     ) -> None:
         if components:
             assert not url, 'Cannot set both "url" and "**components".'
-            url = URL("").replace(**components).components.geturl()
+            self._components = URL("").replace(**components).components
+            self._url = self._components.geturl()
+            return
         elif scope is not None:
             scheme = scope.get("scheme", "http")
             server = scope.get("server", None)
@@ -216,17 +328,15 @@ class URL:
         elif environ is not None:
             scheme = environ["wsgi.url_scheme"]
             server = (environ["SERVER_NAME"], int(environ["SERVER_PORT"]))
-            path = (
-                (environ.get("SCRIPT_NAME", "") + environ.get("PATH_INFO", ""))
-                .encode("latin1")
-                .decode("utf8")
-            )
+            path = environ.get("SCRIPT_NAME", "") + environ.get("PATH_INFO", "")
+            if not path.isascii():  # PEP 3333 passes the raw bytes as latin-1
+                path = path.encode("latin1").decode("utf8")
             query_string = environ.get("QUERY_STRING", "").encode("latin-1")
             host_header = environ.get("HTTP_HOST", None)
             url = self._build_url(scheme, path, query_string, server, host_header)
 
         self._url = url
-        self._components = urlsplit(url)
+        self._components = None  # split on first access
 
     def _build_url(
         self,
@@ -242,7 +352,7 @@ class URL:
             url = path
         else:
             host, port = server
-            default_port = {"http": 80, "https": 443, "ws": 80, "wss": 443}[scheme]
+            default_port = _DEFAULT_PORTS[scheme]
             if port == default_port or port is None:
                 url = f"{scheme}://{host}{path}"
             else:
@@ -255,6 +365,8 @@ class URL:
 
     @property
     def components(self) -> SplitResult:
+        if self._components is None:
+            self._components = _urlsplit(self._url)
         return self._components
 
     @property
@@ -279,19 +391,19 @@ class URL:
 
     @property
     def username(self) -> typing.Optional[str]:
-        return self.components.username
+        return _split_netloc(self.components.netloc)[0]
 
     @property
     def password(self) -> typing.Optional[str]:
-        return self.components.password
+        return _split_netloc(self.components.netloc)[1]
 
     @property
     def hostname(self) -> typing.Optional[str]:
-        return self.components.hostname
+        return _split_netloc(self.components.netloc)[2]
 
     @property
     def port(self) -> typing.Optional[int]:
-        return self.components.port
+        return _netloc_port(self.components.netloc)
 
     def replace(self, **kwargs: typing.Any) -> "URL":
         if (
@@ -300,13 +412,14 @@ class URL:
             or "hostname" in kwargs
             or "port" in kwargs
         ):
+            netloc = self.components.netloc
+            username, password, _ = _split_netloc(netloc)
             hostname = kwargs.pop("hostname", None)
             port = kwargs.pop("port", self.port)
-            username = kwargs.pop("username", self.username)
-            password = kwargs.pop("password", self.password)
+            username = kwargs.pop("username", username)
+            password = kwargs.pop("password", password)
 
             if hostname is None:
-                netloc = self.netloc
                 _, _, hostname = netloc.rpartition("@")
 
                 if hostname[-1] != "]":
@@ -323,31 +436,56 @@ class URL:
 
             kwargs["netloc"] = netloc
 
-        components = self.components._replace(**kwargs)
-        return self.__class__(components.geturl())
+        return self._from_components(self.components._replace(**kwargs))
+
+    @classmethod
+    def _from_components(cls, components: SplitResult) -> "URL":
+        """
+        Create a URL from already split components, without parsing again.
+        """
+        url = cls()
+        url._components = components
+        url._url = components.geturl()
+        return url
 
     def include_query_params(self, **kwargs: typing.Any) -> "URL":
-        params: MutableMultiMapping[str, str] = MutableMultiMapping(
-            parse_qsl(self.query, keep_blank_values=True)
-        )
-        params.update({key: str(value) for key, value in kwargs.items()})
-        query = urlencode(params.multi_items())
+        # Same result as `MutableMultiMapping.update`: an included key keeps
+        # its first position, its other values are dropped, new keys go last.
+        params: typing.List[typing.Tuple[str, typing.Any]] = []
+        included = set()
+        for key, value in _parse_qsl(self.query):
+            if key not in kwargs:
+                params.append((key, value))
+            elif key not in included:
+                params.append((key, kwargs[key]))
+                included.add(key)
+        params.extend(item for item in kwargs.items() if item[0] not in included)
+        # `urlencode` converts non-string values itself
+        query = urlencode(params)
         return self.replace(query=query)
 
     def replace_query_params(self, **kwargs: typing.Any) -> "URL":
-        query = urlencode([(key, str(value)) for key, value in kwargs.items()])
+        query = urlencode(kwargs)
         return self.replace(query=query)
 
     def remove_query_params(self, *keys: str) -> "URL":
-        params: MutableMultiMapping[str, str] = MutableMultiMapping(
-            parse_qsl(self.query, keep_blank_values=True)
+        removed = frozenset(keys)
+        query = urlencode(
+            [
+                (key, value)
+                for key, value in _parse_qsl(self.query)
+                if key not in removed
+            ]
         )
-        [params.pop(key, None) for key in keys]
-        query = urlencode(params.multi_items())
         return self.replace(query=query)
 
     def __eq__(self, other: typing.Any) -> bool:
-        return str(self) == str(other)
+        if isinstance(other, URL):
+            return self._url == other._url
+        return self._url == str(other)
+
+    def __hash__(self) -> int:
+        return hash(self._url)
 
     def __str__(self) -> str:
         return self._url
@@ -360,7 +498,13 @@ class URL:
 
 
 class MultiMapping(typing.Generic[KT, VT], typing.Mapping[KT, VT]):
-    __slots__ = ("_dict", "_list")
+    __slots__ = ("_dict", "_list", "_index")
+
+    _dict: typing.Dict[KT, VT]
+    _list: typing.List[typing.Tuple[KT, VT]]
+    # Values of every key for `getlist`, built on first use and dropped by
+    # every mutation
+    _index: typing.Optional[typing.Dict[KT, typing.List[VT]]]
 
     def __init__(
         self,
@@ -371,13 +515,15 @@ class MultiMapping(typing.Generic[KT, VT], typing.Mapping[KT, VT]):
             ]
         ] = None,
     ) -> None:
+        self._index = None
         _items: typing.List[typing.Tuple[KT, VT]]
         if raw is None:
             _items = []
         elif isinstance(raw, MultiMapping):
-            _items = typing.cast(
-                typing.List[typing.Tuple[KT, VT]], list(raw.multi_items())
-            )
+            # Copy the internal storage directly, skipping `multi_items()` copy
+            self._dict = raw._dict.copy()
+            self._list = raw._list[:]
+            return
         elif isinstance(raw, typing.Mapping):
             _items = typing.cast(typing.List[typing.Tuple[KT, VT]], list(raw.items()))
         else:
@@ -396,7 +542,17 @@ class MultiMapping(typing.Generic[KT, VT], typing.Mapping[KT, VT]):
         return len(self._dict)
 
     def getlist(self, key: KT) -> typing.List[VT]:
-        return [item_value for item_key, item_value in self._list if item_key == key]
+        if key not in self._dict:
+            return []
+        if self._index is None:
+            index: typing.Dict[KT, typing.List[VT]] = {}
+            for item_key, item_value in self._list:
+                if item_key in index:
+                    index[item_key].append(item_value)
+                else:
+                    index[item_key] = [item_value]
+            self._index = index
+        return self._index[key][:]
 
     def multi_items(self) -> typing.List[typing.Tuple[KT, VT]]:
         return list(self._list)
@@ -404,59 +560,99 @@ class MultiMapping(typing.Generic[KT, VT], typing.Mapping[KT, VT]):
     def __eq__(self, other: typing.Any) -> bool:
         if not isinstance(other, self.__class__):
             return False
-        return sorted(self._list) == sorted(other._list)
+        if len(self._list) != len(other._list):
+            return False
+        try:
+            return Counter(self._list) == Counter(other._list)
+        except TypeError:  # unhashable values
+            return sorted(self._list) == sorted(other._list)
 
     def __repr__(self) -> str:
         class_name = self.__class__.__name__
-        items = self.multi_items()
+        items = self._list
         return f"{class_name}({items!r})"
 
 
 class MutableMultiMapping(
     typing.Generic[KT, VT], MultiMapping[KT, VT], typing.MutableMapping[KT, VT]
 ):
-    __slots__ = MultiMapping.__slots__
+    __slots__ = ()
 
     def __setitem__(self, key: KT, value: VT) -> None:
-        indexes = tuple(index for index, kv in enumerate(self._list) if kv[0] == key)
-        if indexes:
-            frist_index = indexes[0]
-            for index in reversed(indexes):
-                if index == frist_index:
-                    self._list[index] = (key, value)
-                else:
-                    del self._list[index]
-        else:
+        self._index = None
+        if key not in self._dict:  # `_dict` mirrors every key of `_list`
             self._list.append((key, value))
+            self._dict[key] = value
+            return
+        # Keep the first pair's position with the new value, drop the others
+        _list: typing.List[typing.Tuple[KT, VT]] = []
+        replaced = False
+        for kv in self._list:
+            if kv[0] != key:
+                _list.append(kv)
+            elif not replaced:
+                _list.append((key, value))
+                replaced = True
+        self._list = _list
         self._dict[key] = value
 
     def __delitem__(self, key: KT) -> None:
-        _list = self._list[:]
-        self._list.clear()
-        self._list.extend((k, v) for k, v in _list if k != key)
         del self._dict[key]
+        self._index = None
+        self._list[:] = [kv for kv in self._list if kv[0] != key]
+
+    def update(self, *args: typing.Any, **kwargs: VT) -> None:
+        """
+        Same result as calling `__setitem__` for every item, but rebuilds the
+        pair list once instead of scanning it for each key.
+        """
+        new: typing.Dict[KT, VT] = dict(*args, **kwargs)
+        if not new:
+            return
+        _list: typing.List[typing.Tuple[KT, VT]] = []
+        updated = set()
+        for kv in self._list:
+            key = kv[0]
+            if key not in new:
+                _list.append(kv)
+            elif key not in updated:
+                _list.append((key, new[key]))
+                updated.add(key)
+        _list.extend((k, v) for k, v in new.items() if k not in updated)
+        self._list[:] = _list
+        self._index = None
+        self._dict.update(new)
 
     def setlist(self, key: KT, values: typing.Sequence[VT]) -> None:
-        if values:
-            self._list = [
-                *((k, v) for k, v in self._list if k != key),
-                *((key, value) for value in values),
-            ]
-            self._dict[key] = values[-1]
-        elif key in self:
-            del self[key]
+        if not values:
+            if key in self:
+                del self[key]
+            return
+        if key in self._dict:  # Only existing keys need their old pairs dropped
+            self._list = [kv for kv in self._list if kv[0] != key]
+        self._list.extend((key, value) for value in values)
+        self._dict[key] = values[-1]
+        self._index = None
 
     def poplist(self, key: KT) -> typing.List[VT]:
-        values = [v for k, v in self._list if k == key]
-        try:
-            del self[key]
-        except KeyError:
-            pass
+        if key not in self._dict:
+            return []
+        del self._dict[key]
+        values: typing.List[VT] = []
+        remaining: typing.List[typing.Tuple[KT, VT]] = []
+        for kv in self._list:
+            if kv[0] == key:
+                values.append(kv[1])
+            else:
+                remaining.append(kv)
+        self._list[:] = remaining
+        self._index = None
         return values
 
     def append(self, key: KT, value: VT) -> None:
         self._list.append((key, value))
         self._dict[key] = value
+        self._index = None
 
 
 class QueryParams(MultiMapping[str, str]):
@@ -464,7 +660,7 @@ class QueryParams(MultiMapping[str, str]):
     An immutable MutableMultiMapping.
     """
 
-    __slots__ = ("_dict", "_list")
+    __slots__ = ("_str",)
 
     def __init__(
         self,
@@ -478,15 +674,22 @@ class QueryParams(MultiMapping[str, str]):
             ]
         ] = None,
     ) -> None:
-        if isinstance(raw, str):
-            super().__init__(parse_qsl(raw, keep_blank_values=True))
-        elif isinstance(raw, bytes):
-            super().__init__(parse_qsl(raw.decode("latin-1"), keep_blank_values=True))
+        self._str: typing.Optional[str] = None
+        if isinstance(raw, (str, bytes)):
+            if isinstance(raw, bytes):
+                raw = raw.decode("latin-1")
+            # `_parse_qsl` returns a fresh list, no need to copy it again
+            items = _parse_qsl(raw)
+            self._dict = dict(items)
+            self._list = items
+            self._index = None
         else:
             super().__init__(raw)
 
     def __str__(self) -> str:
-        return urlencode(self._list)
+        if self._str is None:  # Immutable, so encode only once
+            self._str = urlencode(self._list)
+        return self._str
 
     def __repr__(self) -> str:
         class_name = self.__class__.__name__
@@ -516,43 +719,86 @@ class Headers(typing.Mapping[str, str]):
             items = ()
         else:
             items = headers
+        repeated: typing.Optional[typing.Dict[str, typing.List[str]]] = None
         for key, value in items:
             key = key.lower()
-            if key in store:
-                store[key] = f"{store[key]}, {value}"
-            else:
+            if key not in store:
                 store[key] = value
+            elif repeated is None:
+                repeated = {key: [store[key], value]}
+            elif key in repeated:
+                repeated[key].append(value)
+            else:
+                repeated[key] = [store[key], value]
+        if repeated is not None:  # Join once instead of growing the string
+            for key, values in repeated.items():
+                store[key] = ", ".join(values)
 
         self._dict = store
 
     def __getitem__(self, key: str) -> str:
         return self._dict[key.lower()]
 
+    @typing.overload
+    def get(self, key: str) -> typing.Optional[str]: ...
+
+    @typing.overload
+    def get(self, key: str, default: typing.Union[str, T]) -> typing.Union[str, T]: ...
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        # `Mapping.get` goes through `__getitem__` and catches `KeyError`,
+        # which is slow for the headers that are usually absent.
+        return self._dict.get(key.lower(), default)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key.lower() in self._dict
+
     def __iter__(self) -> typing.Iterator[str]:
         return self._dict.__iter__()
 
     def __len__(self) -> int:
         return self._dict.__len__()
 
+    # The `Mapping` views would look every key up again through `__getitem__`
+    def keys(self) -> typing.KeysView[str]:
+        return self._dict.keys()
+
+    def values(self) -> typing.ValuesView[str]:
+        return self._dict.values()
+
+    def items(self) -> typing.ItemsView[str, str]:
+        return self._dict.items()
+
+
+def _check_header(key: str, value: str) -> None:
+    if "\n" in key or "\r" in key or "\0" in key:
+        raise ValueError("Header names must not contain control characters.")
+    if "\n" in value or "\r" in value or "\0" in value:
+        raise ValueError("Header values must not contain control characters.")
+
 
 class MutableHeaders(Headers, typing.MutableMapping[str, str]):
-    __slots__ = Headers.__slots__
+    __slots__ = ()
 
     def __setitem__(self, key: str, value: str) -> None:
-        if "\n" in key or "\r" in key or "\0" in key:
-            raise ValueError("Header names must not contain control characters.")
-        if "\n" in value or "\r" in value or "\0" in value:
-            raise ValueError("Header values must not contain control characters.")
+        _check_header(key, value)
         self._dict[key.lower()] = value
 
     def __delitem__(self, key: str) -> None:
         del self._dict[key.lower()]
 
     def append(self, key: str, value: str) -> None:
-        if key in self:
-            self[key] = f"{self[key]}, {value}"
-        else:
-            self[key] = value
+        # The stored value was checked when set, only the new one needs it
+        _check_header(key, value)
+        key = key.lower()
+        current = self._dict.get(key)
+        self._dict[key] = value if current is None else f"{current}, {value}"
+
+
+# Same condition as `shutil`, sendfile between regular files is Linux only
+_USE_SENDFILE: Final[bool] = (
+    hasattr(os, "sendfile") and sys.platform.startswith("linux")
+)
 
 
 class UploadFile:
@@ -560,20 +806,49 @@ class UploadFile:
     An uploaded file included as part of the request data.
     """
 
-    __slots__ = ("filename", "headers", "content_type", "file")
+    __slots__ = ("filename", "headers", "content_type", "_file", "_pending")
 
     spool_max_size = 1024 * 1024
+    # Once rolled to disk, `awrite` collects this much before a thread hop
+    write_buffer_size = 256 * 1024
 
     def __init__(self, filename: str, headers: Headers) -> None:
         self.filename = filename
         self.headers = headers
         self.content_type = headers.get("content-type", "")
-        self.file = SpooledTemporaryFile(max_size=self.spool_max_size, mode="w+b")
+        self._file: typing.Optional["SpooledTemporaryFile[bytes]"] = None
+        self._pending = bytearray()
+
+    @property
+    def file(self) -> "SpooledTemporaryFile[bytes]":
+        """
+        The spooled file, created on first use so that empty uploads never
+        allocate one. Data buffered by `awrite` is written out before returning.
+        """
+        if self._file is None:
+            self._file = SpooledTemporaryFile(max_size=self.spool_max_size, mode="w+b")
+        if self._pending:
+            self._flush()
+        return self._file
+
+    @file.setter
+    def file(self, file: "SpooledTemporaryFile[bytes]") -> None:
+        # Data still buffered by `awrite` belonged to the replaced file
+        self._pending.clear()
+        self._file = file
+
+    def _flush(self) -> None:
+        # `_pending` only fills up after the spool has rolled to disk
+        assert self._file is not None
+        self._file.write(self._pending)
+        self._pending.clear()
 
     @property
     def in_memory(self) -> bool:
-        rolled_to_disk = getattr(self.file, "_rolled", True)
-        return not rolled_to_disk
+        if self._file is None:
+            return True
+        # A file that is not a `SpooledTemporaryFile` counts as on disk
+        return not getattr(self._file, "_rolled", True)
 
     def write(self, data: bytes) -> None:
         self.file.write(data)
@@ -582,7 +857,9 @@ class UploadFile:
         if self.in_memory:
             self.write(data)
         else:
-            await run_in_threadpool(self.write, data)
+            self._pending += data
+            if len(self._pending) >= self.write_buffer_size:
+                await run_in_threadpool(self._flush)
 
     def read(self, size: int = -1) -> bytes:
         return self.file.read(size)
@@ -602,7 +879,9 @@ class UploadFile:
             await run_in_threadpool(self.seek, offset)
 
     def close(self) -> None:
-        self.file.close()
+        self._pending.clear()
+        if self._file is not None:
+            self._file.close()
 
     async def aclose(self) -> None:
         if self.in_memory:
@@ -614,19 +893,22 @@ class UploadFile:
         """
         Save file to disk.
         """
-        # from shutil.COPY_BUFSIZE
-        copy_bufsize = 1024 * 1024 if os.name == "nt" else 64 * 1024
         file_position = self.file.tell()
         self.file.seek(0, 0)
         try:
             with open(filepath, "wb+") as target_file:
-                source_read = self.file.read
-                target_write = target_file.write
-                while True:
-                    buf = source_read(copy_bufsize)
-                    if not buf:
-                        break
-                    target_write(buf)
+                if self.in_memory or not _USE_SENDFILE:
+                    shutil.copyfileobj(self.file, target_file)
+                else:  # Let the kernel copy between the two files
+                    self.file.flush()
+                    source_fd, target_fd = self.file.fileno(), target_file.fileno()
+                    size = os.fstat(source_fd).st_size
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(target_fd, source_fd, offset, size - offset)
+                        if not sent:
+                            break
+                        offset += sent
         finally:
             self.file.seek(file_position)
 
@@ -642,14 +924,14 @@ class FormData(MultiMapping[str, typing.Union[str, UploadFile]]):
     An immutable MultiMapping, containing both file uploads and text input.
     """
 
-    __slots__ = MultiMapping.__slots__
+    __slots__ = ()
 
     def close(self) -> None:
-        for key, value in self.multi_items():
+        for key, value in self._list:
             if isinstance(value, UploadFile):
                 value.close()
 
     async def aclose(self) -> None:
-        for key, value in self.multi_items():
+        for key, value in self._list:
             if isinstance(value, UploadFile):
                 await value.aclose()
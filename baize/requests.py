@@ -33,19 +33,26 @@ class MoreInfoFromHeaderMixin:
         """
         Request's accepted types
         """
-        return [
-            MediaType(token)
-            for token in self.headers.get("Accept", "*/*").split(",")
-            if token.strip()
-        ]
+        accept = self.headers.get("Accept", "*/*")
+        if "," not in accept:
+            return [MediaType(accept)] if accept.strip() else []
+        return [MediaType(token) for token in accept.split(",") if token.strip()]
+
+    @cached_property
+    def _accepts_cache(self) -> Dict[str, bool]:
+        return {}
 
     def accepts(self, media_type: str) -> bool:
         """
         e.g. `request.accepts("application/json")`
         """
-        return any(
-            accepted_type.match(media_type) for accepted_type in self.accepted_types
-        )
+        cache = self._accepts_cache
+        result = cache.get(media_type)
+        if result is None:
+            result = cache[media_type] = any(
+                accepted_type.match(media_type) for accepted_type in self.accepted_types
+            )
+        return result
 
     @cached_property
     def content_type(self) -> ContentType:
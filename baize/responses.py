@@ -1,4 +1,6 @@
 import datetime
+import functools
+import mimetypes
 import os
 import re
 import time
@@ -32,7 +34,56 @@ except ImportError:  # pragma: no cover
 
 from .datastructures import Cookie, MutableHeaders
 from .exceptions import MalformedRangeHeader, RangeNotSatisfiable
-from .typing import Literal, ServerSentEvent
+from .typing import Final, Literal, ServerSentEvent
+
+# Header names repeat across every response, and a few values are static.
+# Keep their latin-1 encoded bytes around instead of re-encoding every time.
+_HEADER_BYTES_CACHE_SIZE: Final[int] = 1024
+_STATIC_HEADER_NAMES: Final[Tuple[str, ...]] = (
+    "accept-ranges",
+    "cache-control",
+    "connection",
+    "content-disposition",
+    "content-length",
+    "content-range",
+    "content-type",
+    "etag",
+    "last-modified",
+    "location",
+    "vary",
+)
+_STATIC_HEADER_VALUES: Final[Tuple[str, ...]] = (
+    "bytes",
+    "keep-alive",
+    "no-cache",
+    "text/event-stream; charset=utf-8",
+    "text/html; charset=utf-8",
+    "text/plain; charset=utf-8",
+    "application/json",
+    "application/octet-stream",
+)
+_header_bytes_cache: Dict[str, bytes] = {
+    s: s.encode("latin-1") for s in _STATIC_HEADER_NAMES
+}
+_static_header_value_bytes: Final[Dict[str, bytes]] = {
+    s: s.encode("latin-1") for s in _STATIC_HEADER_VALUES
+}
+
+
+def _encode_header_name(name: str) -> bytes:
+    encoded = _header_bytes_cache.get(name)
+    if encoded is None:
+        encoded = name.encode("latin-1")
+        if len(_header_bytes_cache) < _HEADER_BYTES_CACHE_SIZE:
+            _header_bytes_cache[name] = encoded
+    return encoded
+
+
+def _encode_header_value(value: str) -> bytes:
+    encoded = _static_header_value_bytes.get(value)
+    if encoded is None:
+        return value.encode("latin-1")
+    return encoded
 
 
 @mypyc_attr(allow_interpreted_subclasses=True)
@@ -110,7 +161,7 @@ class BaseResponse:
         if as_bytes:
             return [
                 *(
-                    (key.encode("latin-1"), value.encode("latin-1"))
+                    (_encode_header_name(key), _encode_header_value(value))
                     for key, value in self.headers.items()
                 ),
                 *((b"set-cookie", bytes(cookie)) for cookie in self.cookies),
@@ -122,6 +173,9 @@ class BaseResponse:
             ]
 
 
+_range_spec_findall = re.compile(r"(\d*)-(\d*)").findall
+
+
 @trait
 class FileResponseMixin:
     def generate_common_headers(
@@ -177,14 +231,13 @@ class FileResponseMixin:
         if unit != "bytes":
             raise MalformedRangeHeader("Only support bytes range")
 
-        ranges = [
-            (
-                int(_[0]) if _[0] else max_size - int(_[1]),
-                int(_[1]) + 1 if _[0] and _[1] and int(_[1]) < max_size else max_size,
-            )
-            for _ in re.findall(r"(\d*)-(\d*)", ranges_str)
-            if _ != ("", "")
-        ]
+        ranges: List[Tuple[int, int]] = []
+        for start_str, end_str in _range_spec_findall(ranges_str):
+            if start_str:
+                end = min(int(end_str) + 1, max_size) if end_str else max_size
+                ranges.append((int(start_str), end))
+            elif end_str:
+                ranges.append((max_size - int(end_str), max_size))
 
         if len(ranges) == 0:
             raise MalformedRangeHeader("Range header: range must be requested")
@@ -278,11 +331,41 @@ def build_bytes_from_sse(event: ServerSentEvent, charset: str) -> bytes:
     )
 
 
+@functools.lru_cache(maxsize=512)
+def _guess_type_by_extension(extension: str) -> Optional[str]:
+    return mimetypes.guess_type("x" + extension)[0]
+
+
+def guess_content_type(filename: str) -> Optional[str]:
+    """
+    `mimetypes.guess_type(filename)[0]`, memoized by file extension.
+    """
+    extension = os.path.splitext(filename)[1]
+    if (
+        not extension
+        or extension in mimetypes.suffix_map
+        or extension in mimetypes.encodings_map
+    ):
+        # e.g. `.tgz` or `.tar.gz`, the type depends on more than the last suffix
+        return mimetypes.guess_type(filename)[0]
+    return _guess_type_by_extension(extension)
+
+
+_IRI_SAFE_CHARS: Final[str] = "/#%[]=:;$&()+,!?*@'~"
+# `quote` never escapes ASCII letters, digits, "_.-~" and the characters in `safe`
+_is_safe_uri = re.compile(
+    "[A-Za-z0-9_.\\-%s]*" % re.escape(_IRI_SAFE_CHARS)
+).fullmatch
+
+
 def iri_to_uri(iri: str) -> str:
     """
     Convert an Internationalized Resource Identifier (IRI) portion to a URI portion
     that is suitable for inclusion in a URL.
     """
+    # Most URLs contain nothing that `quote` would escape
+    if _is_safe_uri(iri):
+        return iri
     # Copy from django
     # https://github.com/django/django/blob/main/django/utils/encoding.py#L100
-    return quote(iri, safe="/#%[]=:;$&()+,!?*@'~")
+    return quote(iri, safe=_IRI_SAFE_CHARS)
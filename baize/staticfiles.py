@@ -1,10 +1,12 @@
 import importlib.util
 import os
+import re
 import stat
+import time
 from email.utils import parsedate_to_datetime
-from typing import Generic, Optional, Tuple, TypeVar, Union
+from typing import Dict, Generic, Optional, Set, Tuple, TypeVar, Union
 
-from .responses import BaseResponse
+from .responses import BaseResponse, FileResponseMixin
 from .typing import ASGIApp, Literal, WSGIApp
 
 try:
@@ -17,6 +19,11 @@ except ImportError:  # pragma: no cover
 
 Interface = TypeVar("Interface", ASGIApp, WSGIApp)
 
+_StatCacheItem = Tuple[Optional[os.stat_result], bool, float]
+
+# Matches one entity-tag of `If-None-Match`: a (weak) quoted tag or a bare token
+_etag_findall = re.compile(r'(?:W/)?"([^"]*)"|([^\s,]+)').findall
+
 
 @mypyc_attr(allow_interpreted_subclasses=True)
 class BaseFiles(Generic[Interface]):
@@ -28,6 +35,8 @@ class BaseFiles(Generic[Interface]):
         handle_404: Optional[Interface] = None,
         cacheability: Literal["public", "private", "no-cache", "no-store"] = "public",
         max_age: int = 60 * 10,  # 10 minutes
+        stat_cache_ttl: float = 0,
+        stat_cache_max_size: int = 1024,
     ) -> None:
         assert not (
             os.path.isabs(directory) and package is not None
@@ -36,6 +45,11 @@ class BaseFiles(Generic[Interface]):
         self.handle_404: Optional[Interface] = handle_404
         self.cacheability = cacheability
         self.max_age = max_age
+        # With a positive `stat_cache_ttl`, a file changed within the TTL is
+        # still served with its old size and validators. Off by default.
+        self.stat_cache_ttl = stat_cache_ttl
+        self.stat_cache_max_size = stat_cache_max_size
+        self._stat_cache: Dict[str, _StatCacheItem] = {}
 
     def normalize_dir_path(self, directory: str, package: Optional[str] = None) -> str:
         if package is None:
@@ -72,34 +86,83 @@ class BaseFiles(Generic[Interface]):
     ) -> Tuple[Optional[os.stat_result], bool]:
         if path is None:
             return None, False
+
+        if self.stat_cache_ttl <= 0 or self.stat_cache_max_size <= 0:
+            return self._stat(path)
+
+        now = time.monotonic()
+        cached = self._stat_cache.get(path)
+        if cached is not None and now < cached[2]:
+            return cached[0], cached[1]
+
+        stat_result, is_file = self._stat(path)
+        # The cache is shared by every thread of a WSGI server, so another
+        # thread may refresh or evict the same entry at the same time
+        if cached is not None:  # Expired, re-insert it as the newest entry
+            self._stat_cache.pop(path, None)
+        elif len(self._stat_cache) >= self.stat_cache_max_size:
+            # Evict only the oldest entry, not the whole cache
+            try:
+                del self._stat_cache[next(iter(self._stat_cache))]
+            except (KeyError, RuntimeError, StopIteration):
+                pass
+        self._stat_cache[path] = (stat_result, is_file, now + self.stat_cache_ttl)
+        return stat_result, is_file
+
+    def _stat(self, path: str) -> Tuple[Optional[os.stat_result], bool]:
         try:
             stat_result = os.stat(path)
             return stat_result, stat.S_ISREG(stat_result.st_mode)
         except FileNotFoundError:
             return None, False
 
+    @staticmethod
+    def _parse_etag_list(if_none_match: str) -> Tuple[bool, Set[str]]:
+        """
+        Parse `If-None-Match` into `(has_star, etags)`, weak tags are
+        compared as strong ones.
+        """
+        has_star = False
+        etags = set()
+        for quoted, bare in _etag_findall(if_none_match):
+            if bare == "*":
+                has_star = True
+            else:
+                etags.add(quoted or bare)
+        return has_star, etags
+
     def if_none_match(self, etag: str, if_none_match: str) -> bool:
         if not if_none_match:
             return False
 
-        if if_none_match == "*":
-            return True
-
-        if if_none_match.startswith("W/"):
-            if_none_match = if_none_match[2:]
-
-        return any(etag == i.strip().strip('"') for i in if_none_match.split(","))
+        has_star, etags = self._parse_etag_list(if_none_match)
+        return has_star or etag in etags
 
     def if_modified_since(self, last_modified: float, if_modified_since: str) -> bool:
         try:
             if not if_modified_since:
                 raise ValueError("Empty date value")
             modified_time = parsedate_to_datetime(if_modified_since).timestamp()
-        except ValueError:
+        except (TypeError, ValueError):  # TypeError for bad dates before 3.10
             return False
 
         return int(last_modified) <= int(modified_time)
 
+    def not_modified(
+        self, stat_result: os.stat_result, if_none_match: str, if_modified_since: str
+    ) -> bool:
+        """
+        Whether the client's cached copy is still valid, judging by
+        `If-None-Match` first and then `If-Modified-Since`. The ETag is only
+        generated when `If-None-Match` is present.
+        """
+        if if_none_match and self.if_none_match(
+            FileResponseMixin.generate_etag(stat_result), if_none_match
+        ):
+            return True
+        # Compare with the value sent in the `Last-Modified` header
+        return self.if_modified_since(stat_result.st_mtime, if_modified_since)
+
     def set_response_headers(self, response: BaseResponse) -> None:
         response.headers.append(
             "Cache-Control", f"{self.cacheability}, max-age={self.max_age}"
@@ -61,6 +61,15 @@ def parse_header(line: str) -> typing.Tuple[str, typing.Dict[str, str]]:
     Return the main content-type and a dictionary of options.
 
     """
+    if '"' not in line:  # Fast path, no quoted `;` to care about
+        key, *params = line.split(";")
+        pdict = {}
+        for p in params:
+            name, eq, value = p.partition("=")
+            if eq:
+                pdict[name.strip().lower()] = value.strip()
+        return key.strip(), pdict
+
     parts = _parseparam(";" + line)
     key = parts.__next__()
     pdict = {}
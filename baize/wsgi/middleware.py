@@ -89,14 +89,13 @@ def middleware(
         This is the actual middleware.
         """
 
+        def next_call(request: NextRequest) -> NextResponse:
+            next_response = NextResponse.from_app(app, request)
+            return next_response
+
         @functools.wraps(app)
         def wsgi(environ: Environ, start_response: StartResponse) -> Iterable[bytes]:
             request = NextRequest(environ, start_response)
-
-            def next_call(request: NextRequest) -> NextResponse:
-                next_response = NextResponse.from_app(app, request)
-                return next_response
-
             response = handler(request, next_call)
             yield from response(environ, start_response)
 
@@ -88,14 +88,15 @@ class HTTPConnection(Mapping[str, Any], MoreInfoFromHeaderMixin):
 
         Note that in its internal storage, all keys are in lower case.
         """
-        return Headers(
-            (
-                (key[5:] if key.startswith("HTTP_") else key).lower().replace("_", "-"),
-                value,
-            )
-            for key, value in self._environ.items()
-            if key.startswith("HTTP_") or key in ("CONTENT_TYPE", "CONTENT_LENGTH")
-        )
+        items = []
+        for key, value in self._environ.items():
+            if key.startswith("HTTP_"):
+                items.append((key[5:].lower().replace("_", "-"), value))
+            elif key == "CONTENT_TYPE":
+                items.append(("content-type", value))
+            elif key == "CONTENT_LENGTH":
+                items.append(("content-length", value))
+        return Headers(items)
 
 
 class Request(HTTPConnection):
@@ -4,7 +4,6 @@ import os
 import queue
 import stat
 from http import HTTPStatus
-from mimetypes import guess_type
 from random import choices as random_choices
 from typing import (
     Any,
@@ -12,6 +11,7 @@ from typing import (
     Generator,
     Generic,
     Iterable,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -27,10 +27,13 @@ from baize.responses import (
     BaseResponse,
     FileResponseMixin,
     build_bytes_from_sse,
+    guess_content_type,
     iri_to_uri,
 )
 from baize.typing import Environ, ServerSentEvent, StartResponse
 
+_PING = b": ping\n\n"
+
 StatusStringMapping = defaultdict(
     lambda status: f"{status} Unknown Status Code",
     {int(status): f"{status} {status.phrase}" for status in HTTPStatus},
@@ -81,10 +84,10 @@ class SmallResponse(Response, abc.ABC, Generic[_ContentType]):
     def render(self, content: _ContentType) -> bytes:
         raise NotImplementedError
 
-    def __call__(
-        self, environ: Environ, start_response: StartResponse
-    ) -> Iterable[bytes]:
-        body = self.render(self.content)
+    def set_body_headers(self, body: bytes) -> None:
+        """
+        Fill in `content-length` and `content-type` unless they were given.
+        """
         if body and "content-length" not in self.headers:
             content_length = str(len(body))
             self.headers["content-length"] = content_length
@@ -93,6 +96,12 @@ class SmallResponse(Response, abc.ABC, Generic[_ContentType]):
             if content_type.startswith("text/"):
                 content_type += "; charset=" + self.charset
             self.headers["content-type"] = content_type
+
+    def __call__(
+        self, environ: Environ, start_response: StartResponse
+    ) -> Iterable[bytes]:
+        body = self.render(self.content)
+        self.set_body_headers(body)
         start_response(
             StatusStringMapping[self.status_code], self.list_headers(as_bytes=False)
         )
@@ -100,10 +109,25 @@ class SmallResponse(Response, abc.ABC, Generic[_ContentType]):
 
 
 class PlainTextResponse(SmallResponse[Union[bytes, str]]):
+    """
+    The encoded body is reused while `content` stays the same object and
+    `charset` is unchanged, so a response object can be sent repeatedly.
+    """
+
     media_type = "text/plain"
+    _rendered: Optional[Tuple[Union[bytes, str], str, bytes]] = None
 
     def render(self, content: Union[bytes, str]) -> bytes:
-        return content.encode(self.charset) if isinstance(content, str) else content
+        rendered = self._rendered
+        if (
+            rendered is not None
+            and rendered[0] is content
+            and rendered[1] == self.charset
+        ):
+            return rendered[2]
+        body = content.encode(self.charset) if isinstance(content, str) else content
+        self._rendered = (content, self.charset, body)
+        return body
 
 
 class HTMLResponse(PlainTextResponse):
@@ -268,7 +292,7 @@ class SendEventResponse(StreamingResponse[ServerSentEvent]):
                         break
                     yield build_bytes_from_sse(event, self.charset)
                 except queue.Empty:
-                    yield b": ping\n\n"
+                    yield _PING
         finally:
             should_stop = True
             while not q.empty():
@@ -300,7 +324,7 @@ class FileResponse(Response, FileResponseMixin):
         self.filepath = filepath
         self.content_type = (
             content_type
-            or guess_type(download_name or os.path.basename(filepath))[0]
+            or guess_content_type(download_name or os.path.basename(filepath))
             or "application/octet-stream"
         )
         self.download_name = download_name
@@ -314,15 +338,31 @@ class FileResponse(Response, FileResponseMixin):
             )
         )
 
+    def _list_headers_with(self, headers: Dict[str, str]) -> List[Tuple[str, str]]:
+        """
+        Like `self.list_headers(as_bytes=False)`, but `headers` override the
+        same-named entries for this call only. `self.headers` stays untouched,
+        so one instance can serve concurrent requests.
+        """
+        return [
+            *(
+                item
+                for item in self.list_headers(as_bytes=False)
+                if item[0] not in headers
+            ),
+            *headers.items(),
+        ]
+
     def handle_all(
         self,
         send_header_only: bool,
         file_size: int,
         start_response: StartResponse,
     ) -> Generator[bytes, None, None]:
-        self.headers["content-type"] = str(self.content_type)
-        self.headers["content-length"] = str(file_size)
-        start_response(StatusStringMapping[200], self.list_headers(as_bytes=False))
+        headers = self._list_headers_with(
+            {"content-type": self.content_type, "content-length": str(file_size)}
+        )
+        start_response(StatusStringMapping[200], headers)
 
         if send_header_only:
             yield b""
@@ -340,10 +380,14 @@ class FileResponse(Response, FileResponseMixin):
         start: int,
         end: int,
     ) -> Generator[bytes, None, None]:
-        self.headers["content-range"] = f"bytes {start}-{end-1}/{file_size}"
-        self.headers["content-type"] = str(self.content_type)
-        self.headers["content-length"] = str(end - start)
-        start_response(StatusStringMapping[206], self.list_headers(as_bytes=False))
+        headers = self._list_headers_with(
+            {
+                "content-range": f"bytes {start}-{end-1}/{file_size}",
+                "content-type": self.content_type,
+                "content-length": str(end - start),
+            }
+        )
+        start_response(StatusStringMapping[206], headers)
         if send_header_only:
             yield b""
             return
@@ -361,13 +405,16 @@ class FileResponse(Response, FileResponseMixin):
         ranges: Sequence[Tuple[int, int]],
     ) -> Generator[bytes, None, None]:
         boundary = "".join(random_choices("abcdefghijklmnopqrstuvwxyz0123456789", k=13))
-        self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
         content_length, generate_headers = self.generate_multipart(
             ranges, boundary, file_size, self.content_type
         )
-        self.headers["content-length"] = str(content_length)
-
-        start_response(StatusStringMapping[206], self.list_headers(as_bytes=False))
+        headers = self._list_headers_with(
+            {
+                "content-type": f"multipart/byteranges; boundary={boundary}",
+                "content-length": str(content_length),
+            }
+        )
+        start_response(StatusStringMapping[206], headers)
         if send_header_only:
             yield b""
             return
@@ -25,9 +25,7 @@ class Files(staticfiles.BaseFiles[WSGIApp]):
         if_none_match: str,
         if_modified_since: str,
     ) -> Response:
-        if self.if_none_match(
-            FileResponse.generate_etag(stat_result), if_none_match
-        ) or self.if_modified_since(stat_result.st_ctime, if_modified_since):
+        if self.not_modified(stat_result, if_none_match, if_modified_since):
             response = Response(304)
         else:
             response = FileResponse(filepath, stat_result=stat_result)
@@ -37,12 +35,12 @@ class Files(staticfiles.BaseFiles[WSGIApp]):
     def __call__(
         self, environ: Environ, start_response: StartResponse
     ) -> Iterable[bytes]:
-        if_none_match: str = environ.get("HTTP_IF_NONE_MATCH", "")
-        if_modified_since: str = environ.get("HTTP_IF_MODIFIED_SINCE", "")
         filepath = self.ensure_absolute_path(environ.get("PATH_INFO", ""))
         stat_result, is_file = self.check_path_is_file(filepath)
         if is_file and stat_result:
             assert filepath is not None  # Just for type check
+            if_none_match: str = environ.get("HTTP_IF_NONE_MATCH", "")
+            if_modified_since: str = environ.get("HTTP_IF_MODIFIED_SINCE", "")
             return self.file_response(
                 filepath, stat_result, if_none_match, if_modified_since
             )(environ, start_response)
@@ -67,8 +65,6 @@ class Pages(Files):
     def __call__(
         self, environ: Environ, start_response: StartResponse
     ) -> Iterable[bytes]:
-        if_none_match: str = environ.get("HTTP_IF_NONE_MATCH", "")
-        if_modified_since: str = environ.get("HTTP_IF_MODIFIED_SINCE", "")
         filepath = self.ensure_absolute_path(environ.get("PATH_INFO", ""))
         stat_result, is_file = self.check_path_is_file(filepath)
         if (
@@ -82,6 +78,8 @@ class Pages(Files):
         if stat_result is not None:
             assert filepath is not None  # Just for type check
             if is_file:
+                if_none_match: str = environ.get("HTTP_IF_NONE_MATCH", "")
+                if_modified_since: str = environ.get("HTTP_IF_MODIFIED_SINCE", "")
                 return self.file_response(
                     filepath, stat_result, if_none_match, if_modified_since
                 )(environ, start_response)
@@ -1,5 +1,6 @@
 import asyncio
 import tempfile
+import time
 from functools import partial
 from inspect import cleandoc
 from pathlib import Path
@@ -518,6 +519,15 @@ async def test_cookies_invalid(set_cookie, expected):
         assert result["cookies"] == expected
 
 
+def test_cookies_inner_whitespace():
+    # A long run of spaces inside a value must be parsed in linear time
+    value = "x" + " " * 8000 + "y"
+    scope = {"type": "http", "headers": [(b"cookie", f"a={value}".encode())]}
+    started = time.perf_counter()
+    assert Request(scope).cookies == {"a": value}
+    assert time.perf_counter() - started < 0.1
+
+
 # ######################################################################################
 # ################################# Responses tests ####################################
 # ######################################################################################
@@ -590,6 +600,27 @@ async def test_redirect_response():
         assert response.url == "http://testserver/"
 
 
+@pytest.mark.asyncio
+async def test_plain_text_response_render():
+    class UpperResponse(PlainTextResponse):
+        async def render(self, content):
+            return (await super().render(content)).upper()
+
+    response = UpperResponse("hello")
+
+    async def app(scope, receive, send):
+        await response(scope, receive, send)
+
+    async with httpx.AsyncClient(app=app, base_url="http://testServer/") as client:
+        assert (await client.get("/")).text == "HELLO"
+        response.content = "world"
+        del response.headers["content-length"]
+        assert (await client.get("/")).text == "WORLD"
+        response.charset = "utf-16"
+        del response.headers["content-length"]
+        assert (await client.get("/")).content == "WORLD".encode("utf-16")
+
+
 @pytest.mark.asyncio
 async def test_stream_response():
     async def generator(num: int) -> AsyncGenerator[bytes, None]:
@@ -654,6 +685,10 @@ async def test_file_response(tmp_path: Path, response_class: Type[FileResponse])
         response = await client.get("/", headers={"Range": "bytes=0-100, 200-300"})
         assert response.status_code == 206
         assert response.headers["content-length"] == str(370)
+        assert len(response.content) == 370
+        boundary = response.headers["content-type"].split("boundary=")[1]
+        assert response.content.endswith(f"\n--{boundary}--\n".encode("ascii"))
+        assert README.encode("utf8")[200:301] in response.content
 
         response = await client.head("/", headers={"Range": "bytes=0-100, 200-300"})
         assert response.status_code == 206
@@ -692,6 +727,33 @@ async def test_file_response(tmp_path: Path, response_class: Type[FileResponse])
         assert response.headers["Content-Range"] == f"*/{len(README.encode('utf8'))}"
 
 
+@pytest.mark.asyncio
+async def test_file_response_with_pathsend(tmp_path: Path):
+    filepath = tmp_path / "README.txt"
+    filepath.write_bytes(README.encode("utf8"))
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [],
+        "extensions": {"http.response.pathsend": {}},
+    }
+    await FileResponse(str(filepath))(scope, receive, send)
+    assert [message["type"] for message in messages] == [
+        "http.response.start",
+        "http.response.pathsend",
+    ]
+    assert messages[1]["path"] == str(filepath)
+
+
 @pytest.mark.asyncio
 async def test_file_response_with_directory(tmp_path: Path):
     with pytest.raises(IsADirectoryError):
@@ -861,6 +923,21 @@ def test_websocket_send_and_receive_bytes():
         assert data == b"Message was: Hello, world!"
 
 
+def test_websocket_send_many():
+    @websocket_session
+    async def app(websocket: WebSocket) -> None:
+        with pytest.raises(RuntimeError):
+            await websocket.send_many(["too early"])
+        await websocket.accept()
+        await websocket.send_many(["hello", b"world"])
+        await websocket.close()
+
+    client = TestClient(app)
+    with client.websocket_connect("/") as websocket:
+        assert websocket.receive_text() == "hello"
+        assert websocket.receive_bytes() == b"world"
+
+
 def test_websocket_iter_text():
     @websocket_session
     async def app(websocket: WebSocket) -> None:
@@ -1000,6 +1077,19 @@ def test_duplicate_disconnect():
             websocket.close()
 
 
+@pytest.mark.asyncio
+async def test_websocket_unexpected_message_type():
+    async def receive() -> Message:
+        return {"type": "websocket.connect"}
+
+    async def send(message: Message) -> None:
+        pass
+
+    websocket = WebSocket({"type": "websocket", "headers": []}, receive, send)
+    with pytest.raises(RuntimeError):
+        await websocket.send({"type": "websocket.send", "text": "hello"})
+
+
 def test_websocket_scope_interface():
     """
     A WebSocket can be instantiated with a scope, and presents a `Mapping`
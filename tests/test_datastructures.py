@@ -1,3 +1,4 @@
+import datetime
 import os
 import tempfile
 
@@ -43,6 +44,7 @@ def test_url():
 
     new = URL(**u.components._asdict())
     assert new == u
+    assert hash(new) == hash(u) == hash(str(u))
 
     ipv6_url = URL("https://[fe::2]:12345")
     new = ipv6_url.replace(port=8080)
@@ -74,6 +76,12 @@ def test_url_query_params():
     assert str(u) == "https://example.org/path/?order=name"
     u = u.remove_query_params("order")
     assert str(u) == "https://example.org/path/"
+    assert str(u.include_query_params(page=1, q="a b")) == (
+        "https://example.org/path/?page=1&q=a+b"
+    )
+    assert str(u.replace_query_params(page=2)) == "https://example.org/path/?page=2"
+    u = URL("https://example.org/path/?a=1&b=2&a=3&c=")
+    assert str(u.remove_query_params("a", "d")) == "https://example.org/path/?b=2&c="
 
 
 def test_hidden_password():
@@ -162,6 +170,11 @@ def test_cookie():
     assert cookie == Cookie("session", "1234567890", path="/", httponly=True)
     assert cookie != 1234567890
     assert repr(cookie) == "<Cookie session: 1234567890>"
+    assert str(Cookie("a", "")).startswith('a=""; ')
+    assert str(Cookie("a", "b c\xe9")).startswith('a="b c\\351"; ')
+    assert str(Cookie("a", "b", expires=datetime.datetime(2024, 3, 5, 7, 8, 9))) == (
+        "a=b; expires=Tue, 05 Mar 2024 07:08:09 GMT; samesite=lax"
+    )
 
 
 def test_media_type():
@@ -184,6 +197,8 @@ def test_headers():
     assert "c" not in h
     assert h["a"] == "123, 456"
     assert h.get("nope", default=None) is None
+    assert h.get("nope", "") == ""
+    assert h.get("B") == "789"
 
 
 def test_mutable_headers():
@@ -207,6 +222,8 @@ def test_mutable_headers():
     assert dict(h) == {"vary": "vary", "a": "0", "b": "4", "c": "8"}
     h.append("vary", "vary2")
     assert dict(h) == {"vary": "vary, vary2", "a": "0", "b": "4", "c": "8"}
+    h.append("Vary", "vary3")
+    assert dict(h) == {"vary": "vary, vary2, vary3", "a": "0", "b": "4", "c": "8"}
 
     with pytest.raises(
         ValueError, match="Header values must not contain control characters."
@@ -228,6 +245,12 @@ def test_mutable_headers():
     ):
         h["has\n"] = "value"
 
+    with pytest.raises(
+        ValueError, match="Header values must not contain control characters."
+    ):
+        h.append("Vary", "has\r\n")
+    assert h["vary"] == "vary, vary2, vary3"
+
 
 def test_url_blank_params():
     q = QueryParams("a=123&abc&def&b=456")
@@ -266,6 +289,12 @@ def test_queryparams():
     )
     assert QueryParams() == QueryParams({})
     assert QueryParams([("a", "123"), ("a", "456")]) == QueryParams("a=123&a=456")
+    assert QueryParams("a&&b=&c=1=2").multi_items() == [
+        ("a", ""),
+        ("b", ""),
+        ("c", "1=2"),
+    ]
+    assert QueryParams("a=%20b+c").multi_items() == [("a", " b c")]
     assert QueryParams({"a": "123", "b": "456"}) != "invalid"
 
     q = QueryParams([("a", "123"), ("a", "456")])
@@ -281,6 +310,40 @@ def test_sync_upload_file():
     file.close()
 
 
+def test_empty_upload_file():
+    file = UploadFile("file", Headers())
+    assert file.in_memory
+    file.close()
+    assert file._file is None
+    assert file.read() == b""
+    file.close()
+
+    file = UploadFile("file", Headers())
+    spooled = tempfile.SpooledTemporaryFile()
+    spooled.write(b"data")
+    file.file = spooled
+    assert file.file is spooled
+    file.seek(0)
+    assert file.read() == b"data"
+    file.close()
+
+
+@pytest.mark.asyncio
+async def test_upload_file_assigned_plain_file():
+    file = UploadFile("file", Headers())
+    file.file = tempfile.TemporaryFile()
+    assert not file.in_memory
+    await file.awrite(b"abc")
+    await file.aseek(0)
+    assert await file.aread() == b"abc"
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "filename")
+        await file.asave(filepath)
+        with open(filepath, "rb") as f:
+            assert f.read() == b"abc"
+    await file.aclose()
+
+
 @pytest.mark.asyncio
 async def test_async_upload_file():
     file = UploadFile("file", Headers())
@@ -417,6 +480,13 @@ def test_mutable_multi_mapping():
     q.setlist("a", [])
     assert "a" not in q
 
+    q = MutableMultiMapping([("a", "123"), ("b", "456"), ("a", "789")])
+    q.update({"c": "0", "a": "1"}, b="2")
+    assert q.multi_items() == [("a", "1"), ("b", "2"), ("c", "0")]
+    q.update([("d", "3"), ("d", "4")])
+    assert q.getlist("d") == ["4"]
+    assert dict(q) == {"a": "1", "b": "2", "c": "0", "d": "4"}
+
     q = MutableMultiMapping([("a", "123")])
     assert q.setdefault("a", "456") == "123"
     assert q.getlist("a") == ["123"]
@@ -425,6 +495,8 @@ def test_mutable_multi_mapping():
     assert q == MutableMultiMapping([("a", "123"), ("b", "456")])
 
     q = MutableMultiMapping([("a", "123")])
+    assert q.getlist("a") == ["123"]
+    q.getlist("a").append("junk")
     q.append("a", "456")
     assert q.getlist("a") == ["123", "456"]
     assert q == MutableMultiMapping([("a", "123"), ("a", "456")])
@@ -39,3 +39,20 @@ def test_referrer():
         {"referer": "http://www.example.org/hypertext/Overview.html"}
     ).referrer == URL("http://www.example.org/hypertext/Overview.html")
     assert FakeRequest({}).referrer is None
+
+
+def test_accepts():
+    request = FakeRequest({"Accept": "text/html, application/*;q=0.9"})
+    assert request.accepts("text/html")
+    assert request.accepts("application/json")
+    assert request.accepts("application/json")
+    assert not request.accepts("image/png")
+    assert FakeRequest({}).accepts("image/png")
+
+
+def test_accepted_types():
+    assert [str(t) for t in FakeRequest({}).accepted_types] == ["*/*"]
+    assert FakeRequest({"Accept": " "}).accepted_types == []
+    assert [
+        str(t) for t in FakeRequest({"Accept": "text/html,, */*;q=0.8"}).accepted_types
+    ] == ["text/html", "*/*; q=0.8"]
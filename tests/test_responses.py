@@ -1,9 +1,10 @@
+import mimetypes
 from pathlib import Path
 
 import pytest
 
 from baize.exceptions import MalformedRangeHeader, RangeNotSatisfiable
-from baize.responses import FileResponseMixin
+from baize.responses import FileResponseMixin, guess_content_type
 
 
 def test_base_file_response_parse_range(tmp_path: Path):
@@ -49,3 +50,12 @@ def test_base_file_response_parse_range(tmp_path: Path):
 
     with pytest.raises(RangeNotSatisfiable):
         response.parse_range("bytes=-9999", 4623)
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["a.txt", "a.TXT", "a.json", "a.tar.gz", "a.tgz", "a.gz", "README", "a.unknown"],
+)
+def test_guess_content_type(filename: str):
+    assert guess_content_type(filename) == mimetypes.guess_type(filename)[0]
+    assert guess_content_type(filename) == mimetypes.guess_type(filename)[0]
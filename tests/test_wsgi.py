@@ -331,6 +331,26 @@ def test_redirect_response():
         assert response.url == "http://testserver/"
 
 
+def test_plain_text_response_render():
+    class UpperResponse(PlainTextResponse):
+        def render(self, content):
+            return super().render(content).upper()
+
+    response = UpperResponse("hello")
+
+    def app(environ, start_response):
+        return response(environ, start_response)
+
+    with httpx.Client(app=app, base_url="http://testServer/") as client:
+        assert client.get("/").text == "HELLO"
+        response.content = "world"
+        del response.headers["content-length"]
+        assert client.get("/").text == "WORLD"
+        response.charset = "utf-16"
+        del response.headers["content-length"]
+        assert client.get("/").content == "WORLD".encode("utf-16")
+
+
 def test_stream_response():
     def generator(num: int) -> Generator[bytes, None, None]:
         for i in range(num):
@@ -635,6 +655,17 @@ def test_files(app):
             )
         ).status_code == 304
 
+        assert (
+            client.get(
+                "/py.typed",
+                headers={"if-none-match": '"other", W/' + resp.headers["etag"]},
+            )
+        ).status_code == 304
+
+        assert (
+            client.get("/py.typed", headers={"if-none-match": '"other"'})
+        ).status_code == 200
+
         assert (
             client.get("/py.typed", headers={"if-none-match": "*"})
         ).status_code == 304
@@ -667,6 +698,27 @@ def test_files(app):
             assert client.get("/").status_code == 404
 
 
+def test_files_stat_cache(tmp_path: Path):
+    filepath = tmp_path / "index.html"
+    filepath.write_text("index", encoding="utf8")
+
+    app = Files(tmp_path, stat_cache_ttl=60)
+    stat_result, is_file = app.check_path_is_file(str(filepath))
+    assert is_file and stat_result is not None
+    filepath.unlink()
+    assert app.check_path_is_file(str(filepath)) == (stat_result, True)
+
+    app = Files(tmp_path)
+    assert app.check_path_is_file(str(filepath)) == (None, False)
+
+    app = Files(tmp_path, stat_cache_ttl=60, stat_cache_max_size=1)
+    other = tmp_path / "other.html"
+    other.write_text("other", encoding="utf8")
+    assert app.check_path_is_file(str(filepath)) == (None, False)
+    assert app.check_path_is_file(str(other))[1]
+    assert list(app._stat_cache) == [str(other)]
+
+
 def test_pages(tmpdir):
     (tmpdir / "index.html").write_text(
         "<html><body>index</body></html>", encoding="utf8"